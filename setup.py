@@ -40,11 +40,13 @@ setup(
     ],
     extras_require={
         "async": ["aiohttp>=3.7.3,<4"],
+        "brotli": ["urllib3[brotli]>=1.25,<3"],
         "dev": [
             "coverage>=4.4.2",
             "coveralls>=2.1.0",
             "tox>=3.21.0",
          ],
+        "orjson": ["orjson>=3.0.0,<4"],
         "socks": ["requests[socks]>=2.27.0,<3"],
         "test": ["vcrpy>=1.10.3"],
     },
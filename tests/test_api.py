@@ -1,11 +1,19 @@
+import copy
+import io
 import os
+import pickle
 import shutil
+import threading
 import time
 import unittest
 from ast import literal_eval
+from unittest import mock
+
+import requests
 
 from config import tape, TweepyTestCase, username
-from tweepy import API, FileCache, MemoryCache
+from tweepy import API, FileCache, MemoryCache, OAuth1UserHandler
+from tweepy.errors import NotFound, TweepyException
 from tweepy.models import Friendship
 from tweepy.parsers import Parser
 
@@ -409,6 +417,346 @@ class TweepyAPITests(TweepyTestCase):
         self.assertFalse(self.api.cached_result)
 
 
+def create_response(status_code=200, content=b'{}', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
+
+class TweepyAPIRequestTests(unittest.TestCase):
+
+    def setUp(self):
+        self.api = API(OAuth1UserHandler(
+            'consumer_key', 'consumer_secret', 'access_token',
+            'access_token_secret'
+        ))
+
+    def _request_concurrently(self, call, count=5):
+        results = []
+        errors = []
+
+        def target():
+            try:
+                results.append(call())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def testcoalescegetrequests(self):
+        release = threading.Event()
+
+        def request(*args, **kwargs):
+            release.wait(5)
+            return create_response(content=b'{"id": 1, "text": "test"}')
+
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=request
+        ) as session_request:
+            threads, results, errors = self._request_concurrently(
+                lambda: self.api.get_status(1)
+            )
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(session_request.call_count, 1)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.api._inflight, {})
+
+    def testcoalescegetrequestsexception(self):
+        release = threading.Event()
+
+        def request(*args, **kwargs):
+            release.wait(5)
+            return create_response(status_code=404)
+
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=request
+        ) as session_request:
+            threads, results, errors = self._request_concurrently(
+                lambda: self.api.get_status(1)
+            )
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(session_request.call_count, 1)
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 5)
+        self.assertTrue(all(isinstance(e, NotFound) for e in errors))
+        self.assertEqual(self.api._inflight, {})
+
+    def testwaitonratelimit(self):
+        self.api.wait_on_rate_limit = True
+        response = create_response(
+            content=b'{"id": 1, "text": "test"}', headers={
+                'x-rate-limit-remaining': '0',
+                'x-rate-limit-reset': str(int(time.time()) + 30)
+            }
+        )
+        with mock.patch.object(
+            self.api.session, 'request', return_value=response
+        ), mock.patch('tweepy.api.time.sleep') as sleep:
+            self.api.retweet(1)
+            sleep.assert_not_called()
+            # Rate limits are shared by requests for different IDs
+            self.api.retweet(2)
+        sleep.assert_called_once()
+        self.assertGreater(sleep.call_args[0][0], 0)
+        self.assertEqual(
+            list(self.api._rate_limits), ['/1.1/statuses/retweet/:id.json']
+        )
+
+    def testnowaitonratelimit(self):
+        response = create_response(
+            content=b'{"id": 1, "text": "test"}', headers={
+                'x-rate-limit-remaining': '0',
+                'x-rate-limit-reset': str(int(time.time()) + 30)
+            }
+        )
+        with mock.patch.object(
+            self.api.session, 'request', return_value=response
+        ) as session_request, mock.patch('tweepy.api.time.sleep') as sleep:
+            self.api.retweet(1)
+            self.api.retweet(2)
+        sleep.assert_not_called()
+        self.assertEqual(
+            session_request.call_args[0][1],
+            'https://api.twitter.com/1.1/statuses/retweet/2.json'
+        )
+        self.assertEqual(self.api._rate_limits, {})
+
+    def testcopyandpickle(self):
+        for api in (copy.deepcopy(self.api),
+                    pickle.loads(pickle.dumps(self.api))):
+            self.assertEqual(api._inflight, {})
+            self.assertIsNot(api._inflight_lock, self.api._inflight_lock)
+            with mock.patch.object(
+                api.session, 'request', return_value=create_response(
+                    content=b'{"id": 1, "text": "test"}'
+                )
+            ):
+                self.assertEqual(api.get_status(1).id, 1)
+
+    def testsplitlookup(self):
+        kwargs = {'user_id': range(250), 'include_entities': True}
+        lookups = self.api._split_lookup(('user_id', 'screen_name'), kwargs)
+        self.assertEqual(lookups, [
+            {'user_id': ','.join(map(str, range(0, 100)))},
+            {'user_id': ','.join(map(str, range(100, 200)))},
+            {'user_id': ','.join(map(str, range(200, 250)))}
+        ])
+        # Lookup parameters are removed from the other parameters
+        self.assertEqual(kwargs, {'include_entities': True})
+
+    def testsplitlookupcsv(self):
+        lookups = self.api._split_lookup(('id',), {'id': '1,2,3'})
+        self.assertEqual(lookups, [{'id': '1,2,3'}])
+
+        ids = ','.join(map(str, range(150)))
+        lookups = self.api._split_lookup(('id',), {'id': ids})
+        self.assertEqual(lookups, [
+            {'id': ','.join(map(str, range(0, 100)))},
+            {'id': ','.join(map(str, range(100, 150)))}
+        ])
+
+    def testsplitlookupmixed(self):
+        lookups = self.api._split_lookup(
+            ('user_id', 'screen_name'),
+            {'user_id': [1, 2], 'screen_name': ['a', 'b']}
+        )
+        self.assertEqual(lookups, [{'user_id': '1,2', 'screen_name': 'a,b'}])
+
+        # Each request looks up either user IDs or screen names, once there
+        # are more than 100 of them in total
+        lookups = self.api._split_lookup(
+            ('user_id', 'screen_name'),
+            {'user_id': range(60), 'screen_name': ['a'] * 60}
+        )
+        self.assertEqual(lookups, [
+            {'user_id': ','.join(map(str, range(60)))},
+            {'screen_name': ','.join(['a'] * 60)}
+        ])
+
+    def testsplitlookupempty(self):
+        for items in ([], ''):
+            lookups = self.api._split_lookup(('id',), {'id': items})
+            self.assertEqual(lookups, [{'id': None}])
+        self.assertEqual(self.api._split_lookup(('id',), {}), [{}])
+
+    def testlookuprequest(self):
+        def request(method, url, params, **kwargs):
+            ids = params['user_id'].split(',')
+            return create_response(content=(
+                '[' + ','.join(f'{{"id": {id}}}' for id in ids) + ']'
+            ).encode())
+
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=request
+        ) as session_request:
+            users = self.api.lookup_users(user_id=range(250))
+        self.assertEqual([user.id for user in users], list(range(250)))
+        self.assertEqual(session_request.call_count, 3)
+
+    def testlookupcache(self):
+        self.api.cache = MemoryCache(60)
+
+        def request(method, url, params, **kwargs):
+            ids = params['id'].split(',')
+            return create_response(content=(
+                '[' + ','.join(f'{{"id": {id}}}' for id in ids) + ']'
+            ).encode())
+
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=request
+        ) as session_request:
+            self.assertEqual(len(self.api.lookup_statuses(range(150))), 150)
+            # The first 100 IDs are cached from the previous lookup
+            statuses = self.api.lookup_statuses(range(100))
+        self.assertEqual([status.id for status in statuses], list(range(100)))
+        self.assertEqual(session_request.call_count, 2)
+
+    def testbulkrequest(self):
+        responses = [
+            create_response(content=b'{"id": 1, "member_count": 100}'),
+            create_response(content=b'{"id": 1, "member_count": 150}')
+        ]
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=responses
+        ) as session_request:
+            result = self.api.add_list_members(
+                list_id=1, user_id=range(150)
+            )
+        # Chunks are added one after another, returning the final list
+        self.assertEqual(result.member_count, 150)
+        self.assertEqual(
+            [call[1]['params']['user_id'] for call in
+             session_request.call_args_list],
+            [','.join(map(str, range(0, 100))),
+             ','.join(map(str, range(100, 150)))]
+        )
+
+    def testbulkrequestchunksize(self):
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=[
+                create_response(content=b'{"id": 1}'),
+                create_response(status_code=404, content=b'{"errors": []}')
+            ]
+        ) as session_request:
+            with self.assertRaises(NotFound):
+                self.api.remove_list_members(
+                    list_id=1, screen_name=['a', 'b', 'c'], chunk_size=2
+                )
+        # Requests after a failed one aren't made
+        self.assertEqual(
+            [call[1]['params']['screen_name'] for call in
+             session_request.call_args_list],
+            ['a,b', 'c']
+        )
+
+    def testuploademptyfile(self):
+        # An empty file is uploaded rather than opening the filename
+        with mock.patch.object(
+            self.api.session, 'request', return_value=create_response(
+                content=b'{"media_id": 1}'
+            )
+        ) as session_request:
+            media = self.api.simple_upload(
+                'does_not_exist.png', file=memoryview(b'')
+            )
+        self.assertEqual(media.media_id, 1)
+        self.assertEqual(
+            session_request.call_args[1]['files']['media'][0],
+            'does_not_exist.png'
+        )
+
+    def _chunked_upload(self, file):
+        chunks = []
+
+        def request(method, url, data, files, **kwargs):
+            if data['command'] == 'APPEND':
+                chunks.append(bytes(files['media'][1]))
+                return create_response(content=b'')
+            return create_response(content=b'{"media_id": 1}')
+
+        with mock.patch.object(
+            self.api.session, 'request', side_effect=request
+        ):
+            media = self.api.chunked_upload(
+                'video.mp4', file=file, file_type='video/mp4', chunk_size=512
+            )
+        return media, chunks
+
+    def testchunkeduploadreadonlyfile(self):
+        class ReadOnlyFile:
+            # Has no readinto, and reads fewer bytes than requested
+
+            def __init__(self, data):
+                self.file = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self.file.read(min(size, 100))
+
+            def seek(self, *args):
+                return self.file.seek(*args)
+
+            def tell(self):
+                return self.file.tell()
+
+            def close(self):
+                self.file.close()
+
+        data = bytes(range(256)) * 5
+        media, chunks = self._chunked_upload(ReadOnlyFile(data))
+        self.assertEqual(media.media_id, 1)
+        self.assertEqual(chunks, [data[:512], data[512:1024], data[1024:]])
+
+    def testchunkeduploadnonblockingfile(self):
+        class NonBlockingFile(io.BytesIO):
+            # Has no data available to read after the first chunk
+
+            def readinto(self, buffer):
+                if self.tell():
+                    return None
+                return super().readinto(buffer)
+
+        # Segments aren't sent truncated
+        with self.assertRaises(TweepyException):
+            self._chunked_upload(NonBlockingFile(b'\0' * 1024))
+
+    def testbulkrequestinvalidchunksize(self):
+        with mock.patch.object(self.api.session, 'request') as session_request:
+            for chunk_size in (0, 101):
+                with self.assertRaises(ValueError):
+                    self.api.add_list_members(
+                        list_id=1, user_id=range(150), chunk_size=chunk_size
+                    )
+        session_request.assert_not_called()
+
+    def testcombinelookupresults(self):
+        results = [[1, 2], [3], []]
+        self.assertEqual(
+            self.api._combine_lookup_results(results), [1, 2, 3]
+        )
+        # The result of each request is left as it is
+        self.assertEqual(results, [[1, 2], [3], []])
+        # Results that aren't lists are returned as a list of each result
+        self.assertEqual(
+            self.api._combine_lookup_results([{'a': 1}, {'b': 2}]),
+            [{'a': 1}, {'b': 2}]
+        )
+
+
 class TweepyCacheTests(unittest.TestCase):
     timeout = 0.5
     memcache_servers = ['127.0.0.1:11211']  # must be running for test to pass
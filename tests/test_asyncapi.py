@@ -0,0 +1,196 @@
+import asyncio
+import io
+import time
+import unittest
+from unittest import mock
+
+try:
+    import aiohttp
+except ModuleNotFoundError:
+    aiohttp = None
+
+from tweepy import OAuth1UserHandler
+from tweepy.errors import NotFound
+
+if aiohttp is not None:
+    from tweepy.asynchronous import AsyncAPI
+
+
+async def no_sleep(delay):
+    pass
+
+
+class FakeResponse:
+
+    def __init__(self, status=200, content=b'{}', headers=None):
+        self.status = status
+        self.reason = 'OK' if status == 200 else 'Error'
+        self.headers = headers or {}
+        self.url = 'https://api.twitter.com'
+        self.charset = 'utf-8'
+        self.content = content
+
+    async def read(self):
+        return self.content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeClientSession:
+    """Stands in for :class:`aiohttp.ClientSession`, returning the given
+    responses in order and recording the requests made"""
+
+    def __init__(self, responses, **kwargs):
+        self.responses = list(responses)
+        self.kwargs = kwargs
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, url, *, headers, data, proxy):
+        self.requests.append((method, url, data))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp isn't installed")
+class TweepyAsyncAPITests(unittest.TestCase):
+
+    def setUp(self):
+        self.api = AsyncAPI(OAuth1UserHandler(
+            'consumer_key', 'consumer_secret', 'access_token',
+            'access_token_secret'
+        ), timeout=30)
+
+    def run_with_responses(self, coroutine_function, *responses):
+        # The session is created with the first request, within the event
+        # loop that's running it
+        session = None
+
+        def create_session(**kwargs):
+            nonlocal session
+            session = FakeClientSession(responses, **kwargs)
+            return session
+
+        async def run():
+            try:
+                return await coroutine_function()
+            finally:
+                await self.api.close()
+
+        with mock.patch(
+            'tweepy.asynchronous.api.aiohttp.ClientSession', create_session
+        ):
+            result = asyncio.run(run())
+        return result, session
+
+    def testsession(self):
+        # No requests.Session is created for the aiohttp session to replace
+        self.assertIsNone(self.api.session)
+
+        status, session = self.run_with_responses(
+            lambda: self.api.get_status(1),
+            FakeResponse(content=b'{"id": 1, "text": "Test"}')
+        )
+        self.assertEqual(status.id, 1)
+        self.assertTrue(session.closed)
+        self.assertEqual(
+            session.requests,
+            [('GET', 'https://api.twitter.com/1.1/statuses/show.json?id=1',
+              None)]
+        )
+        timeout = session.kwargs['timeout']
+        self.assertIsNone(timeout.total)
+        self.assertEqual(timeout.sock_connect, 30)
+        self.assertEqual(timeout.sock_read, 30)
+
+    def testconcurrentrequests(self):
+        # Identical requests are made separately, as coroutines can't be
+        # awaited more than once
+        statuses, session = self.run_with_responses(
+            lambda: asyncio.gather(
+                self.api.get_status(1), self.api.get_status(1)
+            ),
+            FakeResponse(content=b'{"id": 1, "text": "Test"}'),
+            FakeResponse(content=b'{"id": 1, "text": "Test"}')
+        )
+        self.assertEqual([status.id for status in statuses], [1, 1])
+        self.assertEqual(len(session.requests), 2)
+
+    def testlookup(self):
+        users, session = self.run_with_responses(
+            lambda: self.api.lookup_users(user_id=range(150)),
+            FakeResponse(content=b'[{"id": 1}]'),
+            FakeResponse(content=b'[{"id": 2}]')
+        )
+        self.assertEqual([user.id for user in users], [1, 2])
+        self.assertEqual(len(session.requests), 2)
+
+    def testretry(self):
+        self.api.retry_count = 1
+        self.api.retry_delay = 5
+        sleep = mock.Mock(side_effect=no_sleep)
+        with mock.patch('tweepy.asynchronous.api.asyncio.sleep', sleep):
+            status, session = self.run_with_responses(
+                lambda: self.api.get_status(1),
+                FakeResponse(status=503),
+                FakeResponse(content=b'{"id": 1, "text": "Test"}')
+            )
+        self.assertEqual(status.id, 1)
+        self.assertEqual(len(session.requests), 2)
+        sleep.assert_called_once_with(5)
+
+    def testerror(self):
+        with self.assertRaises(NotFound):
+            self.run_with_responses(
+                lambda: self.api.get_status(1),
+                FakeResponse(status=404, content=b'{"errors": []}')
+            )
+
+    def testwaitonratelimit(self):
+        self.api.wait_on_rate_limit = True
+        headers = {
+            'x-rate-limit-remaining': '0',
+            'x-rate-limit-reset': str(int(time.time()) + 60)
+        }
+
+        async def get_statuses():
+            await self.api.get_status(1)
+            await self.api.get_status(2)
+
+        sleep = mock.Mock(side_effect=no_sleep)
+        with mock.patch('tweepy.asynchronous.api.asyncio.sleep', sleep):
+            self.run_with_responses(
+                get_statuses,
+                FakeResponse(content=b'{"id": 1}', headers=headers),
+                FakeResponse(content=b'{"id": 2}', headers=headers)
+            )
+        sleep.assert_called_once()
+        self.assertEqual(
+            list(self.api._rate_limits), ['/1.1/statuses/show.json']
+        )
+
+    def testchunkedupload(self):
+        file = io.BytesIO(b'\0' * 1024)
+        media, session = self.run_with_responses(
+            lambda: self.api.chunked_upload(
+                'video.mp4', file=file, file_type='video/mp4', chunk_size=512
+            ),
+            FakeResponse(content=b'{"media_id": 1}'),
+            FakeResponse(content=b''),
+            FakeResponse(content=b''),
+            FakeResponse(content=b'{"media_id": 1}')
+        )
+        self.assertEqual(media.media_id, 1)
+        self.assertTrue(file.closed)
+        self.assertEqual(len(session.requests), 4)
+        for segment_index in range(2):
+            self.assertIn(
+                f'name="segment_index"\r\n\r\n{segment_index}'.encode(),
+                session.requests[segment_index + 1][2]
+            )
@@ -1,6 +1,9 @@
 import random
 import unittest
 
+from oauthlib.oauth1 import Client
+import requests
+
 from config import *
 from tweepy import API, OAuth1UserHandler
 
@@ -35,3 +38,34 @@ class TweepyAuthTests(unittest.TestCase):
         print('Please open: ' + auth_url)
         answer = input('Did Twitter only request read permissions? (y/n) ')
         self.assertEqual('y', answer.lower())
+
+    def testoauth1signature(self):
+        auth = OAuth1UserHandler(
+            'consumer_key', 'consumer_secret', 'access_token', 'access~secret'
+        )
+        oauth = auth.apply_auth()
+        client = Client(
+            'consumer_key', client_secret='consumer_secret',
+            resource_owner_key='access_token',
+            resource_owner_secret='access~secret', decoding=None
+        )
+        oauth.client.nonce = client.nonce = 'nonce'
+        oauth.client.timestamp = client.timestamp = '1650000000'
+
+        request = requests.Request(
+            'GET', 'https://api.twitter.com/1.1/statuses/home_timeline.json',
+            params={'count': 5, 'tweet_mode': 'extended'}
+        ).prepare()
+        _, headers, _ = client.sign(request.url, request.method)
+        self.assertEqual(
+            oauth(request).headers['Authorization'], headers['Authorization']
+        )
+
+        # The HMAC key is recomputed if the secrets change
+        oauth.client.resource_owner_secret = 'other_secret'
+        client.resource_owner_secret = 'other_secret'
+        _, headers, _ = client.sign(request.url, request.method)
+        self.assertEqual(
+            oauth(request.copy()).headers['Authorization'],
+            headers['Authorization']
+        )
@@ -1,9 +1,13 @@
+import time
 import unittest
+from unittest import mock
 
 from config import (
     access_token, access_token_secret, bearer_token, consumer_key,
     consumer_secret, tape, user_id
 )
+import requests
+
 import tweepy
 
 
@@ -237,3 +241,73 @@ class TweepyTestCase(unittest.TestCase):
         job_id = response.data["id"]
         self.client.get_compliance_job(job_id)
         self.client.get_compliance_jobs("tweets")
+
+
+def create_response(headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers or {})
+    response._content = b'{"data": {"id": "1", "text": "Test"}}'
+    return response
+
+
+class TweepyClientRequestTests(unittest.TestCase):
+
+    def test_wait_on_rate_limit(self):
+        client = tweepy.Client("bearer_token", wait_on_rate_limit=True)
+        response = create_response({
+            "x-rate-limit-remaining": "0",
+            "x-rate-limit-reset": str(int(time.time()) + 60)
+        })
+        with mock.patch("tweepy.client.time.sleep") as sleep, \
+                mock.patch.object(
+                    client.session, "request", return_value=response
+                ) as request:
+            client.get_tweet(1)
+            sleep.assert_not_called()
+            # The rate limit of the endpoint applies to other Tweet IDs too
+            client.get_tweet(2)
+            sleep.assert_called_once()
+        self.assertEqual(
+            [call[0][1] for call in request.call_args_list],
+            ["https://api.twitter.com/2/tweets/1",
+             "https://api.twitter.com/2/tweets/2"]
+        )
+        self.assertEqual(
+            list(client._rate_limits), [("GET", "/2/tweets/:id", False)]
+        )
+
+    def test_no_wait_on_rate_limit(self):
+        client = tweepy.Client("bearer_token")
+        response = create_response({
+            "x-rate-limit-remaining": "0",
+            "x-rate-limit-reset": str(int(time.time()) + 60)
+        })
+        with mock.patch("tweepy.client.time.sleep") as sleep, \
+                mock.patch.object(
+                    client.session, "request", return_value=response
+                ):
+            client.get_tweet(1)
+            client.get_tweet(2)
+        sleep.assert_not_called()
+        self.assertEqual(client._rate_limits, {})
+
+    def test_oauth_1_auth(self):
+        client = tweepy.Client(
+            consumer_key="consumer_key", consumer_secret="consumer_secret",
+            access_token="access_token",
+            access_token_secret="access_token_secret"
+        )
+        with mock.patch.object(
+            client.session, "request", return_value=create_response()
+        ) as request:
+            client.get_tweet(1, user_auth=True)
+            client.get_tweet(2, user_auth=True)
+            client.access_token = "other_access_token"
+            client.get_tweet(3, user_auth=True)
+        auths = [call[1]["auth"] for call in request.call_args_list]
+        # The signer is reused until the credentials change
+        self.assertIs(auths[0], auths[1])
+        self.assertIsNot(auths[1], auths[2])
+        self.assertEqual(auths[2].client.resource_owner_key,
+                         "other_access_token")
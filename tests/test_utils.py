@@ -9,3 +9,5 @@ class TweepyUtilsTests(unittest.TestCase):
         self.assertEqual("1,2,3", list_to_csv([1,2,3]))
         self.assertEqual("bird,tweet,nest,egg",
                          list_to_csv(["bird", "tweet", "nest", "egg"]))
+        self.assertEqual("1,2,3", list_to_csv("1,2,3"))
+        self.assertIsNone(list_to_csv(""))
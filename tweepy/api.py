@@ -2,37 +2,54 @@
 # Copyright 2009-2022 Joshua Roesslein
 # See LICENSE for details.
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import contextlib
 import functools
 import imghdr
 import logging
 import mimetypes
+import mmap
+import os
 from platform import python_version
 import sys
+import threading
 import time
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import tweepy
 from tweepy.errors import (
     BadRequest, Forbidden, HTTPException, NotFound, TooManyRequests,
     TweepyException, TwitterServerError, Unauthorized
 )
-from tweepy.models import Model
+from tweepy.models import Model, ResultSet
 from tweepy.parsers import ModelParser, Parser
 from tweepy.utils import list_to_csv
 
 log = logging.getLogger(__name__)
 
+# Exceptions for the HTTP status codes of unsuccessful responses, other than
+# server errors and otherwise unexpected status codes
+HTTP_EXCEPTIONS = {
+    400: BadRequest,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    429: TooManyRequests,
+}
+
+# Maximum number of requests of a split lookup that are made concurrently
+_LOOKUP_MAX_WORKERS = 8
+
 
 def pagination(mode):
+    # Only mark the method for Cursor, rather than wrapping it, so that
+    # paginated endpoints don't pay for an extra call on every request
     def decorator(method):
-        @functools.wraps(method)
-        def wrapper(*args, **kwargs):
-            return method(*args, **kwargs)
-        wrapper.pagination_mode = mode
-        return wrapper
+        method.pagination_mode = mode
+        return method
     return decorator
 
 
@@ -50,6 +67,75 @@ def payload(payload_type, **payload_kwargs):
     return decorator
 
 
+@functools.lru_cache()
+def _guess_media_type(extension):
+    # Media types only depend on the file extension, so guesses are cached
+    # rather than repeated for every upload
+    return mimetypes.guess_type('media' + extension)[0]
+
+
+def _map_media(stack, filename):
+    # Memory-map the media rather than reading it into memory, so that it's
+    # copied straight from the page cache into the multipart request body
+    fp = stack.enter_context(open(filename, 'rb'))
+    try:
+        mapped = stack.enter_context(
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+    except (OSError, ValueError):
+        # Empty files and some special files can't be memory-mapped
+        return fp
+    return stack.enter_context(memoryview(mapped))
+
+
+def _chunk_sizes(fp, chunk_size=None):
+    # Returns the size of the media, and the size and number of the chunks
+    # it's uploaded in
+    if isinstance(fp, memoryview):
+        file_size = len(fp)
+    else:
+        start = fp.tell()
+        fp.seek(0, 2)  # Seek to end of file
+        file_size = fp.tell() - start
+        fp.seek(start)
+
+    min_chunk_size, remainder = divmod(file_size, 1000)
+    min_chunk_size += bool(remainder)
+
+    # Use 1 MiB as default chunk size
+    if chunk_size is None:
+        chunk_size = 1024 * 1024
+    # Max chunk size is 5 MiB
+    chunk_size = max(min(chunk_size, 5 * 1024 * 1024), min_chunk_size)
+
+    segments, remainder = divmod(file_size, chunk_size)
+    segments += bool(remainder)
+
+    return file_size, chunk_size, segments
+
+
+def _read_chunk(fp, buffer, size):
+    # Read the next size bytes of the media into the buffer, using readinto
+    # if the file has it. Raw and non-blocking streams can read fewer bytes
+    # than requested, so reading continues until the chunk is complete.
+    view = memoryview(buffer)[:size]
+    read = 0
+    while read < size:
+        if hasattr(fp, 'readinto'):
+            count = fp.readinto(view[read:])
+        else:
+            data = fp.read(size - read) or b''
+            count = len(data)
+            view[read:read + count] = data
+        if not count:
+            view.release()
+            raise TweepyException(
+                f'Failed to read media: expected {size - read} more bytes'
+            )
+        read += count
+    return view
+
+
 class API:
     """Twitter API v1.1 Interface
 
@@ -79,6 +165,12 @@ class API:
     wait_on_rate_limit
         Whether or not to automatically wait for rate limits to replenish
 
+    Attributes
+    ----------
+    session : requests.Session
+        Requests Session used to make requests to the API. Connections are
+        kept alive and reused across requests until :meth:`close` is called.
+
     Raises
     ------
     TypeError
@@ -132,13 +224,50 @@ class API:
                 str(type(self.parser))
             )
 
-        self.session = requests.Session()
+        self.session = self._create_session()
+
+        # Remaining calls and reset time of the rate limit for each endpoint
+        self._rate_limits = {}
+
+        # Identical GET requests that are currently in flight
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks can't be pickled or copied, and requests in flight are only
+        # shared by the instance that's making them
+        state = self.__dict__.copy()
+        del state['_inflight'], state['_inflight_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    def _create_session(self):
+        # Share a single connection pool across all requests so that
+        # connections to Twitter are kept alive and reused
+        session = requests.Session()
+        session.mount(
+            'https://', HTTPAdapter(pool_connections=10, pool_maxsize=100)
+        )
+        return session
+
+    def close(self):
+        """Close the underlying :class:`requests.Session` and release the
+        connections it holds
+
+        .. versionadded:: 4.9
+        """
+        self.session.close()
 
     def request(
-        self, method, endpoint, *, endpoint_parameters=(), params=None,
-        headers=None, json_payload=None, parser=None, payload_list=False,
-        payload_type=None, post_data=None, files=None, require_auth=True,
-        return_cursors=False, upload_api=False, use_cache=True, **kwargs
+        self, method, endpoint, *, endpoint_parameters=(),
+        rate_limit_endpoint=None, params=None, headers=None,
+        json_payload=None, parser=None, payload_list=False, payload_type=None,
+        post_data=None, files=None, require_auth=True, return_cursors=False,
+        upload_api=False, use_cache=True, **kwargs
     ):
         # If authentication is required and no credentials
         # are provided, throw an error.
@@ -153,6 +282,12 @@ class API:
 
         # Build the request URL
         path = f'/1.1/{endpoint}.json'
+        # Rate limits are shared by every request to an endpoint, regardless
+        # of the IDs in its path, so those endpoints pass a template for them
+        if rate_limit_endpoint is None:
+            rate_limit_key = path
+        else:
+            rate_limit_key = f'/1.1/{rate_limit_endpoint}.json'
         if upload_api:
             url = 'https://' + self.upload_host + path
         else:
@@ -164,14 +299,16 @@ class API:
             if arg is None:
                 continue
             if k not in endpoint_parameters and k != "tweet_mode":
-                log.warning(f'Unexpected parameter: {k}')
+                log.warning("Unexpected parameter: %s", k)
             params[k] = str(arg)
         log.debug("PARAMS: %r", params)
 
         # Query the cache if one is available
         # and this request uses a GET method.
+        cache_key = None
         if use_cache and self.cache and method == 'GET':
-            cache_result = self.cache.get(f'{path}?{urlencode(params)}')
+            cache_key = f'{path}?{urlencode(params)}'
+            cache_result = self.cache.get(cache_key)
             # if cache result found and not expired, return it
             if cache_result:
                 # must restore api reference
@@ -185,102 +322,248 @@ class API:
                 self.cached_result = True
                 return cache_result
 
-        # Monitoring rate limits
-        remaining_calls = None
-        reset_time = None
-
         if parser is None:
             parser = self.parser
+        return_cursors = return_cursors or 'cursor' in params or 'next' in params
+
+        request_kwargs = dict(
+            params=params, headers=headers, json_payload=json_payload,
+            parser=parser, payload_list=payload_list,
+            payload_type=payload_type, post_data=post_data, files=files,
+            return_cursors=return_cursors, cache_key=cache_key,
+            rate_limit_key=rate_limit_key
+        )
+        return self._send_coalesced_request(method, url, **request_kwargs)
+
+    def _send_coalesced_request(self, method, url, **kwargs):
+        if method != 'GET':
+            return self._send_request(method, url, **kwargs)
+
+        # Coalesce concurrent identical GET requests, so that duplicates wait
+        # for and share the response to the request that's already in flight
+        key = (
+            url, tuple(sorted(kwargs['params'].items())), id(kwargs['parser']),
+            kwargs['payload_list'], kwargs['payload_type'],
+            kwargs['return_cursors']
+        )
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = self._inflight[key] = Future()
+        if inflight is not None:
+            return inflight.result()
 
         try:
-            # Continue attempting request until successful
-            # or maximum number of retries is reached.
-            retries_performed = 0
-            while retries_performed <= self.retry_count:
-                if (self.wait_on_rate_limit and reset_time is not None
-                    and remaining_calls is not None
-                    and remaining_calls < 1):
-                    # Handle running out of API calls
-                    sleep_time = reset_time - int(time.time())
-                    if sleep_time > 0:
-                        log.warning(f"Rate limit reached. Sleeping for: {sleep_time}")
-                        time.sleep(sleep_time + 1)  # Sleep for extra sec
-
-                # Apply authentication
-                auth = None
-                if self.auth:
-                    auth = self.auth.apply_auth()
-
-                # Execute request
-                try:
-                    resp = self.session.request(
-                        method, url, params=params, headers=headers,
-                        data=post_data, files=files, json=json_payload,
-                        timeout=self.timeout, auth=auth, proxies=self.proxy
-                    )
-                except Exception as e:
-                    raise TweepyException(f'Failed to send request: {e}').with_traceback(sys.exc_info()[2])
-
-                if 200 <= resp.status_code < 300:
-                    break
-
-                rem_calls = resp.headers.get('x-rate-limit-remaining')
-                if rem_calls is not None:
-                    remaining_calls = int(rem_calls)
-                elif remaining_calls is not None:
-                    remaining_calls -= 1
-
-                reset_time = resp.headers.get('x-rate-limit-reset')
-                if reset_time is not None:
-                    reset_time = int(reset_time)
-
-                retry_delay = self.retry_delay
-                if resp.status_code in (420, 429) and self.wait_on_rate_limit:
-                    if remaining_calls == 0:
-                        # If ran out of calls before waiting switching retry last call
-                        continue
-                    if 'retry-after' in resp.headers:
-                        retry_delay = float(resp.headers['retry-after'])
-                elif self.retry_errors and resp.status_code not in self.retry_errors:
-                    # Exit request loop if non-retry error code
-                    break
-
-                # Sleep before retrying request again
-                time.sleep(retry_delay)
-                retries_performed += 1
-
-            # If an error was returned, throw an exception
-            self.last_response = resp
-            if resp.status_code == 400:
-                raise BadRequest(resp)
-            if resp.status_code == 401:
-                raise Unauthorized(resp)
-            if resp.status_code == 403:
-                raise Forbidden(resp)
-            if resp.status_code == 404:
-                raise NotFound(resp)
-            if resp.status_code == 429:
-                raise TooManyRequests(resp)
+            result = self._send_request(method, url, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _send_request(
+        self, method, url, *, params, headers, json_payload, parser,
+        payload_list, payload_type, post_data, files, return_cursors,
+        cache_key, rate_limit_key
+    ):
+        # Continue attempting request until successful
+        # or maximum number of retries is reached.
+        retries_performed = 0
+        while retries_performed <= self.retry_count:
+            # Handle running out of API calls
+            sleep_time = self._rate_limit_sleep_time(rate_limit_key)
+            if sleep_time > 0:
+                log.warning("Rate limit reached. Sleeping for: %d", sleep_time)
+                time.sleep(sleep_time + 1)  # Sleep for extra sec
+
+            # Apply authentication
+            auth = None
+            if self.auth:
+                auth = self.auth.apply_auth()
+
+            # Execute request
+            try:
+                resp = self.session.request(
+                    method, url, params=params, headers=headers,
+                    data=post_data, files=files, json=json_payload,
+                    timeout=self.timeout, auth=auth, proxies=self.proxy
+                )
+            except Exception as e:
+                raise TweepyException(f'Failed to send request: {e}').with_traceback(sys.exc_info()[2])
+
+            remaining_calls = self._update_rate_limit(rate_limit_key, resp)
+            if self._ran_out_of_calls(resp, remaining_calls):
+                # If ran out of calls before waiting switching retry last call
+                continue
+
+            retry_delay = self._retry_delay(resp)
+            if retry_delay is None:
+                break
+
+            # Sleep before retrying request again
+            time.sleep(retry_delay)
+            retries_performed += 1
+
+        return self._process_response(
+            resp, parser=parser, payload_list=payload_list,
+            payload_type=payload_type, return_cursors=return_cursors,
+            cache_key=cache_key
+        )
+
+    def _ran_out_of_calls(self, resp, remaining_calls):
+        # Requests that ran out of calls are retried once the rate limit
+        # resets, without counting as a retry
+        return (
+            resp.status_code in (420, 429) and self.wait_on_rate_limit
+            and remaining_calls == 0
+        )
+
+    def _retry_delay(self, resp):
+        # Returns the number of seconds to sleep before retrying the request,
+        # or None if it shouldn't be retried
+        if 200 <= resp.status_code < 300:
+            return None
+        if resp.status_code in (420, 429) and self.wait_on_rate_limit:
+            if 'retry-after' in resp.headers:
+                return float(resp.headers['retry-after'])
+        elif self.retry_errors and resp.status_code not in self.retry_errors:
+            # Exit request loop if non-retry error code
+            return None
+        return self.retry_delay
+
+    def _rate_limit_sleep_time(self, rate_limit_key):
+        # Rate limits are tracked across requests, so that waiting happens
+        # before making a request that would exceed them
+        if not self.wait_on_rate_limit:
+            return 0
+        remaining_calls, reset_time = self._rate_limits.get(
+            rate_limit_key, (None, None)
+        )
+        if (reset_time is not None and remaining_calls is not None
+            and remaining_calls < 1):
+            return reset_time - int(time.time())
+        return 0
+
+    def _update_rate_limit(self, rate_limit_key, resp):
+        # Rate limits are only needed to wait for them
+        if not self.wait_on_rate_limit:
+            return None
+
+        remaining_calls, reset_time = self._rate_limits.get(
+            rate_limit_key, (None, None)
+        )
+
+        rem_calls = resp.headers.get('x-rate-limit-remaining')
+        if rem_calls is not None:
+            remaining_calls = int(rem_calls)
+        elif remaining_calls is not None:
+            remaining_calls -= 1
+
+        reset = resp.headers.get('x-rate-limit-reset')
+        if reset is not None:
+            reset_time = int(reset)
+
+        self._rate_limits[rate_limit_key] = remaining_calls, reset_time
+        return remaining_calls
+
+    def _process_response(self, resp, *, parser, payload_list, payload_type,
+                          return_cursors, cache_key):
+        # If an error was returned, throw an exception
+        self.last_response = resp
+        if resp.status_code and not 200 <= resp.status_code < 300:
             if resp.status_code >= 500:
                 raise TwitterServerError(resp)
-            if resp.status_code and not 200 <= resp.status_code < 300:
-                raise HTTPException(resp)
-
-            # Parse the response payload
-            return_cursors = return_cursors or 'cursor' in params or 'next' in params
-            result = parser.parse(
-                resp.text, api=self, payload_list=payload_list,
-                payload_type=payload_type, return_cursors=return_cursors
+            raise HTTP_EXCEPTIONS.get(resp.status_code, HTTPException)(resp)
+
+        # Parse the response payload
+        result = parser.parse(
+            resp.text, api=self, payload_list=payload_list,
+            payload_type=payload_type, return_cursors=return_cursors
+        )
+
+        # Store result into cache if one is available.
+        if cache_key is not None and result:
+            self.cache.store(cache_key, result)
+
+        return result
+
+    def _lookup_request(self, method, endpoint, *, lookup_parameters,
+                        **kwargs):
+        # Larger lookups are made concurrently over the shared session
+        lookups = self._split_lookup(lookup_parameters, kwargs)
+        if len(lookups) == 1:
+            return self.request(method, endpoint, **lookups[0], **kwargs)
+
+        with ThreadPoolExecutor(
+            max_workers=min(_LOOKUP_MAX_WORKERS, len(lookups))
+        ) as executor:
+            results = list(executor.map(
+                lambda lookup: self.request(
+                    method, endpoint, **lookup, **kwargs
+                ), lookups
+            ))
+        return self._combine_lookup_results(results)
+
+    def _bulk_request(self, method, endpoint, *, lookup_parameters,
+                      chunk_size=100, **kwargs):
+        # Bulk endpoints modify the same resource with each request, so
+        # larger requests are split and made one after another
+        for lookup in self._split_bulk_request(
+            lookup_parameters, kwargs, chunk_size
+        ):
+            result = self.request(method, endpoint, **lookup, **kwargs)
+        return result
+
+    def _split_bulk_request(self, lookup_parameters, kwargs, chunk_size):
+        # Check the chunk size before any request is made, as the members of
+        # earlier requests can't be rolled back once a later one fails
+        if not 1 <= chunk_size <= 100:
+            raise ValueError(
+                f"chunk_size must be between 1 and 100, not {chunk_size}"
             )
+        return self._split_lookup(
+            lookup_parameters, kwargs, max_items=chunk_size
+        )
 
-            # Store result into cache if one is available.
-            if use_cache and self.cache and method == 'GET' and result:
-                self.cache.store(f'{path}?{urlencode(params)}', result)
+    def _split_lookup(self, lookup_parameters, kwargs, max_items=100):
+        # Lookup endpoints accept a limited number of items per request, so
+        # larger lookups are split into separate requests
+        lookups = {}
+        for name in lookup_parameters:
+            items = kwargs.pop(name, None)
+            if isinstance(items, str):
+                items = items.split(',') if items else []
+            if items is not None:
+                lookups[name] = list(items)
+
+        if sum(map(len, lookups.values())) <= max_items:
+            return [
+                {name: list_to_csv(items) for name, items in lookups.items()}
+            ]
+
+        return [
+            {name: list_to_csv(items[i:i + max_items])}
+            for name, items in lookups.items()
+            for i in range(0, len(items), max_items)
+        ]
+
+    def _combine_lookup_results(self, results):
+        if not all(isinstance(result, list) for result in results):
+            return results
+        # The result of each request can be cached or shared by coalesced
+        # requests, so they're combined into a new list instead of extended
+        if isinstance(results[0], ResultSet):
+            combined = ResultSet()
+        else:
+            combined = []
+        for lookup_result in results:
+            combined.extend(lookup_result)
+        return combined
 
-            return result
-        finally:
-            self.session.close()
-    
     # Premium Search APIs
 
     @pagination(mode='next')
@@ -630,10 +913,16 @@ class API:
         .. versionchanged:: 4.0
             Renamed from ``API.statuses_lookup``
 
+        .. versionchanged:: 4.9
+            More than 100 IDs are split into concurrent requests, after
+            which ``last_response`` is the response to whichever of them
+            finished last
+
         Parameters
         ----------
         id
-            A list of Tweet IDs to lookup, up to 100
+            A list of Tweet IDs to lookup. More than 100 IDs are looked up
+            with multiple requests, whose results are combined.
         include_entities
             |include_entities|
         trim_user
@@ -654,11 +943,11 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/tweets/post-and-engage/api-reference/get-statuses-lookup
         """
-        return self.request(
+        return self._lookup_request(
             'GET', 'statuses/lookup', endpoint_parameters=(
                 'id', 'include_entities', 'trim_user', 'map',
                 'include_ext_alt_text', 'include_card_uri'
-            ), id=list_to_csv(id), **kwargs
+            ), lookup_parameters=('id',), id=id, **kwargs
         )
 
     @payload('json')
@@ -815,7 +1104,7 @@ class API:
         return self.request(
             'GET', f'statuses/retweets/{id}', endpoint_parameters=(
                 'count', 'trim_user'
-            ), **kwargs
+            ), rate_limit_endpoint='statuses/retweets/:id', **kwargs
         )
 
     @pagination(mode='id')
@@ -981,7 +1270,7 @@ class API:
         return self.request(
             'POST', f'statuses/destroy/{id}', endpoint_parameters=(
                 'trim_user',
-            ), **kwargs
+            ), rate_limit_endpoint='statuses/destroy/:id', **kwargs
         )
 
     @payload('status')
@@ -1008,7 +1297,7 @@ class API:
         return self.request(
             'POST', f'statuses/retweet/{id}', endpoint_parameters=(
                 'trim_user',
-            ), **kwargs
+            ), rate_limit_endpoint='statuses/retweet/:id', **kwargs
         )
 
     @payload('status')
@@ -1036,7 +1325,7 @@ class API:
         return self.request(
             'POST', f'statuses/unretweet/{id}', endpoint_parameters=(
                 'trim_user',
-            ), **kwargs
+            ), rate_limit_endpoint='statuses/unretweet/:id', **kwargs
         )
 
     @payload('status')
@@ -1193,10 +1482,12 @@ class API:
         https://developer.twitter.com/en/docs/twitter-api/v1/tweets/post-and-engage/api-reference/post-statuses-update_with_media
         """
         with contextlib.ExitStack() as stack:
-            if file is not None:
-                files = {'media[]': (filename, file)}
-            else:
-                files = {'media[]': stack.enter_context(open(filename, 'rb'))}
+            files = {
+                'media[]': (
+                    os.path.basename(filename),
+                    file if file is not None else _map_media(stack, filename)
+                )
+            }
             return self.request(
                 'POST', 'statuses/update_with_media', endpoint_parameters=(
                     'status', 'possibly_sensitive', 'in_reply_to_status_id',
@@ -1849,11 +2140,15 @@ class API:
     @payload('list')
     def add_list_members(self, **kwargs):
         """add_list_members(*, list_id, slug, user_id, screen_name, \
-                            owner_screen_name, owner_id)
+                            owner_screen_name, owner_id, chunk_size)
 
-        Add up to 100 members to a list. The authenticated user must own the
-        list to be able to add members to it. Lists are limited to 5,000
-        members.
+        Add members to a list. The authenticated user must own the list to be
+        able to add members to it. Lists are limited to 5,000 members.
+
+        .. versionchanged:: 4.9
+            More than 100 members are split into consecutive requests. If one
+            of them fails, the members of the requests before it have already
+            been added.
 
         Parameters
         ----------
@@ -1863,14 +2158,17 @@ class API:
             |slug|
         user_id
             A comma separated list of user IDs, up to 100 are allowed in a
-            single request
+            single request. Longer lists are added with multiple requests.
         screen_name
             A comma separated list of screen names, up to 100 are allowed in a
-            single request
+            single request. Longer lists are added with multiple requests.
         owner_screen_name
             |owner_screen_name|
         owner_id
             |owner_id|
+        chunk_size
+            The maximum number of members to add with each request, from 1
+            to 100. Defaults to ``100``.
 
         Returns
         -------
@@ -1880,15 +2178,11 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-members-create_all
         """
-        if 'user_id' in kwargs:
-            kwargs['user_id'] = list_to_csv(kwargs['user_id'])
-        if 'screen_name' in kwargs:
-            kwargs['screen_name'] = list_to_csv(kwargs['screen_name'])
-        return self.request(
+        return self._bulk_request(
             'POST', 'lists/members/create_all', endpoint_parameters=(
                 'list_id', 'slug', 'user_id', 'screen_name',
                 'owner_screen_name', 'owner_id'
-            ), **kwargs
+            ), lookup_parameters=('user_id', 'screen_name'), **kwargs
         )
 
     @payload('list')
@@ -1932,11 +2226,16 @@ class API:
     @payload('list')
     def remove_list_members(self, **kwargs):
         """remove_list_members(*, list_id, slug, user_id, screen_name, \
-                               owner_screen_name, owner_id)
+                               owner_screen_name, owner_id, chunk_size)
+
+        Remove members from a list. The authenticated user must own the list
+        to be able to remove members from it. Lists are limited to 5,000
+        members.
 
-        Remove up to 100 members from a list. The authenticated user must own
-        the list to be able to remove members from it. Lists are limited to
-        5,000 members.
+        .. versionchanged:: 4.9
+            More than 100 members are split into consecutive requests. If one
+            of them fails, the members of the requests before it have already
+            been removed.
 
         Parameters
         ----------
@@ -1946,14 +2245,17 @@ class API:
             |slug|
         user_id
             A comma separated list of user IDs, up to 100 are allowed in a
-            single request
+            single request. Longer lists are removed with multiple requests.
         screen_name
             A comma separated list of screen names, up to 100 are allowed in a
-            single request
+            single request. Longer lists are removed with multiple requests.
         owner_screen_name
             |owner_screen_name|
         owner_id
             |owner_id|
+        chunk_size
+            The maximum number of members to remove with each request, from 1
+            to 100. Defaults to ``100``.
 
         Returns
         -------
@@ -1963,15 +2265,11 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/create-manage-lists/api-reference/post-lists-members-destroy_all
         """
-        if 'user_id' in kwargs:
-            kwargs['user_id'] = list_to_csv(kwargs['user_id'])
-        if 'screen_name' in kwargs:
-            kwargs['screen_name'] = list_to_csv(kwargs['screen_name'])
-        return self.request(
+        return self._bulk_request(
             'POST', 'lists/members/destroy_all', endpoint_parameters=(
                 'list_id', 'slug', 'user_id', 'screen_name',
                 'owner_screen_name', 'owner_id'
-            ), **kwargs
+            ), lookup_parameters=('user_id', 'screen_name'), **kwargs
         )
 
     @payload('list')
@@ -2279,12 +2577,19 @@ class API:
         Returns the relationships of the authenticated user to the list of up
         to 100 screen_name or user_id provided.
 
+        .. versionchanged:: 4.9
+            More than 100 users are split into concurrent requests, after
+            which ``last_response`` is the response to whichever of them
+            finished last
+
         Parameters
         ----------
         screen_name
             A list of screen names, up to 100 are allowed in a single request.
+            Longer lists are looked up with multiple requests.
         user_id
             A list of user IDs, up to 100 are allowed in a single request.
+            Longer lists are looked up with multiple requests.
 
         Returns
         -------
@@ -2294,11 +2599,11 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-friendships-lookup
         """
-        return self.request(
+        return self._lookup_request(
             'GET', 'friendships/lookup', endpoint_parameters=(
                 'screen_name', 'user_id'
-            ), screen_name=list_to_csv(screen_name),
-            user_id=list_to_csv(user_id), **kwargs
+            ), lookup_parameters=('screen_name', 'user_id'),
+            screen_name=screen_name, user_id=user_id, **kwargs
         )
 
     @payload('ids')
@@ -2413,12 +2718,19 @@ class API:
         * If none of your lookup criteria can be satisfied by returning a \
             user object, a HTTP 404 will be thrown.
 
+        .. versionchanged:: 4.9
+            More than 100 users are split into concurrent requests, after
+            which ``last_response`` is the response to whichever of them
+            finished last
+
         Parameters
         ----------
         screen_name
             A list of screen names, up to 100 are allowed in a single request.
+            Longer lists are looked up with multiple requests.
         user_id
             A list of user IDs, up to 100 are allowed in a single request.
+            Longer lists are looked up with multiple requests.
         include_entities
             |include_entities|
         tweet_mode
@@ -2434,11 +2746,11 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/follow-search-get-users/api-reference/get-users-lookup
         """
-        return self.request(
+        return self._lookup_request(
             'POST', 'users/lookup', endpoint_parameters=(
                 'screen_name', 'user_id', 'include_entities', 'tweet_mode'
-            ), screen_name=list_to_csv(screen_name),
-            user_id=list_to_csv(user_id), **kwargs
+            ), lookup_parameters=('screen_name', 'user_id'),
+            screen_name=screen_name, user_id=user_id, **kwargs
         )
 
     @pagination(mode='page')
@@ -2691,7 +3003,10 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/manage-account-settings/api-reference/get-saved_searches-show-id
         """
-        return self.request('GET', f'saved_searches/show/{id}', **kwargs)
+        return self.request(
+            'GET', f'saved_searches/show/{id}',
+            rate_limit_endpoint='saved_searches/show/:id', **kwargs
+        )
 
     @payload('json')
     def get_profile_banner(self, **kwargs):
@@ -2869,10 +3184,12 @@ class API:
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/manage-account-settings/api-reference/post-account-update_profile_banner
         """
         with contextlib.ExitStack() as stack:
-            if file is not None:
-                files = {'banner': (filename, file)}
-            else:
-                files = {'banner': stack.enter_context(open(filename, 'rb'))}
+            files = {
+                'banner': (
+                    os.path.basename(filename),
+                    file if file is not None else _map_media(stack, filename)
+                )
+            }
             return self.request(
                 'POST', 'account/update_profile_banner', endpoint_parameters=(
                     'width', 'height', 'offset_left', 'offset_top'
@@ -2906,15 +3223,18 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/manage-account-settings/api-reference/post-account-update_profile_image
         """
-        if file is not None:
-            files = {'image': (filename, file)}
-        else:
-            files = {'image': open(filename, 'rb')}
-        return self.request(
-            'POST', 'account/update_profile_image', endpoint_parameters=(
-                'include_entities', 'skip_status'
-            ), files=files, **kwargs
-        )
+        with contextlib.ExitStack() as stack:
+            files = {
+                'image': (
+                    os.path.basename(filename),
+                    file if file is not None else _map_media(stack, filename)
+                )
+            }
+            return self.request(
+                'POST', 'account/update_profile_image', endpoint_parameters=(
+                    'include_entities', 'skip_status'
+                ), files=files, **kwargs
+            )
 
     @payload('saved_search')
     def create_saved_search(self, query, **kwargs):
@@ -2961,7 +3281,10 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/accounts-and-users/manage-account-settings/api-reference/post-saved_searches-destroy-id
         """
-        return self.request('POST', f'saved_searches/destroy/{id}', **kwargs)
+        return self.request(
+            'POST', f'saved_searches/destroy/{id}',
+            rate_limit_endpoint='saved_searches/destroy/:id', **kwargs
+        )
 
     # Mute, block, and report users
 
@@ -3548,9 +3871,9 @@ class API:
         if file_type is not None:
             file_type = 'image/' + file_type
         else:
-            file_type = mimetypes.guess_type(filename)[0]
+            file_type = _guess_media_type(os.path.splitext(filename)[1])
 
-        if chunked or file_type.startswith('video/'):
+        if chunked or file_type is not None and file_type.startswith('video/'):
             return self.chunked_upload(
                 filename, file=file, file_type=file_type,
                 media_category=media_category,
@@ -3590,10 +3913,12 @@ class API:
         https://developer.twitter.com/en/docs/twitter-api/v1/media/upload-media/api-reference/post-media-upload
         """
         with contextlib.ExitStack() as stack:
-            if file is not None:
-                files = {'media': (filename, file)}
-            else:
-                files = {'media': stack.enter_context(open(filename, 'rb'))}
+            files = {
+                'media': (
+                    os.path.basename(filename),
+                    file if file is not None else _map_media(stack, filename)
+                )
+            }
 
             post_data = {}
             if media_category is not None:
@@ -3608,10 +3933,10 @@ class API:
 
     def chunked_upload(self, filename, *, file=None, file_type=None,
                        wait_for_async_finalize=True, media_category=None,
-                       additional_owners=None, **kwargs):
+                       additional_owners=None, max_workers=1, **kwargs):
         """chunked_upload( \
             filename, *, file, file_type, wait_for_async_finalize, \
-            media_category, additional_owners \
+            media_category, additional_owners, max_workers \
         )
 
         Use this to upload media to Twitter. This uses the chunked upload
@@ -3620,6 +3945,9 @@ class API:
         :func:`API.chunked_upload_finalize`. If ``wait_for_async_finalize`` is
         set, this calls :func:`API.get_media_upload_status` as well.
 
+        .. versionchanged:: 4.9
+            Added ``max_workers`` parameter
+
         Parameters
         ----------
         filename
@@ -3635,6 +3963,10 @@ class API:
             |media_category|
         additional_owners
             |additional_owners|
+        max_workers
+            The maximum number of chunks to upload concurrently, when
+            ``file`` isn't specified. Defaults to ``1``, uploading the chunks
+            one at a time.
 
         Returns
         -------
@@ -3644,37 +3976,51 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/media/upload-media/uploading-media/chunked-media-upload
         """
-        fp = file or open(filename, 'rb')
+        with contextlib.ExitStack() as stack:
+            fp = file if file is not None else _map_media(stack, filename)
 
-        start = fp.tell()
-        fp.seek(0, 2)  # Seek to end of file
-        file_size = fp.tell() - start
-        fp.seek(start)
+            file_size, chunk_size, segments = _chunk_sizes(
+                fp, kwargs.pop('chunk_size', None)
+            )
 
-        min_chunk_size, remainder = divmod(file_size, 1000)
-        min_chunk_size += bool(remainder)
+            media_id = self.chunked_upload_init(
+                file_size, file_type, media_category=media_category,
+                additional_owners=additional_owners, **kwargs
+            ).media_id
 
-        # Use 1 MiB as default chunk size
-        chunk_size = kwargs.pop('chunk_size', 1024 * 1024)
-        # Max chunk size is 5 MiB
-        chunk_size = max(min(chunk_size, 5 * 1024 * 1024), min_chunk_size)
+            if not isinstance(fp, memoryview):
+                # Read each chunk into the same buffer, as they're appended
+                # one at a time
+                buffer = bytearray(chunk_size)
 
-        segments, remainder = divmod(file_size, chunk_size)
-        segments += bool(remainder)
+            def append(segment_index):
+                if isinstance(fp, memoryview):
+                    start = segment_index * chunk_size
+                    chunk = fp[start:start + chunk_size]
+                else:
+                    chunk = _read_chunk(fp, buffer, min(
+                        chunk_size, file_size - segment_index * chunk_size
+                    ))
+                with chunk:
+                    # The APPEND command returns an empty response body
+                    self.chunked_upload_append(
+                        media_id, (os.path.basename(filename), chunk),
+                        segment_index, **kwargs
+                    )
 
-        media_id = self.chunked_upload_init(
-            file_size, file_type, media_category=media_category,
-            additional_owners=additional_owners, **kwargs
-        ).media_id
+            if isinstance(fp, memoryview) and max_workers > 1:
+                # Segments of a mapped file can be sliced independently, so
+                # they can be appended concurrently
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for _ in executor.map(append, range(segments)):
+                        pass
+            else:
+                for segment_index in range(segments):
+                    append(segment_index)
 
-        for segment_index in range(segments):
-            # The APPEND command returns an empty response body
-            self.chunked_upload_append(
-                media_id, (filename, fp.read(chunk_size)), segment_index,
-                **kwargs
-            )
+            if file is not None:
+                file.close()
 
-        fp.close()
         media =  self.chunked_upload_finalize(media_id, **kwargs)
 
         if wait_for_async_finalize and hasattr(media, 'processing_info'):
@@ -3738,14 +4084,13 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/media/upload-media/api-reference/post-media-upload-finalize
         """
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         post_data = {
             'command': 'FINALIZE',
             'media_id': media_id
         }
         return self.request(
-            'POST', 'media/upload', headers=headers, post_data=post_data,
-            upload_api=True, **kwargs
+            'POST', 'media/upload', post_data=post_data, upload_api=True,
+            **kwargs
         )
 
     @payload('media')
@@ -3776,8 +4121,6 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/media/upload-media/api-reference/post-media-upload-init
         """
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-
         post_data = {
             'command': 'INIT',
             'total_bytes': total_bytes,
@@ -3789,8 +4132,8 @@ class API:
             post_data['additional_owners'] = list_to_csv(additional_owners)
 
         return self.request(
-            'POST', 'media/upload', headers=headers, post_data=post_data,
-            upload_api=True, **kwargs
+            'POST', 'media/upload', post_data=post_data, upload_api=True,
+            **kwargs
         )
 
     # Get locations with trending topics
@@ -3932,7 +4275,10 @@ class API:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/geo/place-information/api-reference/get-geo-id-place_id
         """
-        return self.request('GET', f'geo/id/{place_id}', **kwargs)
+        return self.request(
+            'GET', f'geo/id/{place_id}',
+            rate_limit_endpoint='geo/id/:place_id', **kwargs
+        )
 
     # Get places near a location
 
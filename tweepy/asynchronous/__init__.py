@@ -17,4 +17,5 @@ except ModuleNotFoundError:
         "tweepy.asynchronous requires aiohttp and oauthlib to be installed"
     )
 
+from tweepy.asynchronous.api import AsyncAPI
 from tweepy.asynchronous.streaming import AsyncStream
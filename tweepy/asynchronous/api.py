@@ -0,0 +1,255 @@
+# Tweepy
+# Copyright 2009-2022 Joshua Roesslein
+# See LICENSE for details.
+
+import asyncio
+import logging
+import os
+from platform import python_version
+import time
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import tweepy
+from tweepy.api import API, _chunk_sizes
+from tweepy.errors import TweepyException
+
+log = logging.getLogger(__name__)
+
+
+class AsyncAPI(API):
+    """Asynchronous Twitter API v1.1 Interface
+
+    .. versionadded:: 4.9
+
+    This has the same methods and parameters as :class:`API`, but each
+    method returns a coroutine that has to be awaited. Requests are made
+    through a single :class:`aiohttp.ClientSession`, so that many requests
+    can be made concurrently, e.g. with :func:`asyncio.gather`. Lookups of
+    more than 100 items are also split into concurrent requests. Unlike with
+    :class:`API`, concurrent identical GET requests aren't coalesced.
+
+    :class:`Cursor` can't be used with :class:`AsyncAPI`.
+
+    Parameters
+    ----------
+    auth
+        The authentication handler to be used
+    limit_per_host
+        The maximum number of simultaneous connections to each host
+    kwargs
+        Any other :class:`API` parameters
+
+    Attributes
+    ----------
+    session : aiohttp.ClientSession | None
+        Aiohttp client session used to make requests to the API
+    """
+
+    def __init__(self, auth=None, *, limit_per_host=64, **kwargs):
+        kwargs.setdefault('user_agent', (
+            f"Python/{python_version()} "
+            f"aiohttp/{aiohttp.__version__} "
+            f"Tweepy/{tweepy.__version__}"
+        ))
+        super().__init__(auth, **kwargs)
+        self.limit_per_host = limit_per_host
+        self._pending_calls = {}
+
+    def _create_session(self):
+        # The aiohttp client session has to be created within the event loop
+        # it's used in, so it's created with the first request instead
+        return None
+
+    async def close(self):
+        """Close the aiohttp client session"""
+        if self.session is not None:
+            await self.session.close()
+
+    def request(self, *args, **kwargs):
+        result = super().request(*args, **kwargs)
+        if self.cached_result:
+            return self._return_cached(result)
+        return result
+
+    async def _return_cached(self, result):
+        return result
+
+    def _send_coalesced_request(self, method, url, **kwargs):
+        # Coroutines can only be awaited once, so they can't be shared by
+        # concurrent requests
+        return self._send_request(method, url, **kwargs)
+
+    def _send_request(
+        self, method, url, *, params, headers, json_payload, parser,
+        payload_list, payload_type, post_data, files, return_cursors,
+        cache_key, rate_limit_key
+    ):
+        # Build the request body now, as any files that are part of it are
+        # closed once the calling method returns
+        prepared = requests.Request(
+            method, url, params=params, headers=headers, data=post_data,
+            files=files, json=json_payload
+        ).prepare()
+        return self._send_prepared_request(
+            rate_limit_key, prepared, parser=parser, payload_list=payload_list,
+            payload_type=payload_type, return_cursors=return_cursors,
+            cache_key=cache_key
+        )
+
+    async def _send_prepared_request(self, rate_limit_key, prepared,
+                                     **kwargs):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.limit_per_host
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.timeout, sock_read=self.timeout
+                )
+            )
+
+        # Continue attempting request until successful
+        # or maximum number of retries is reached.
+        retries_performed = 0
+        while retries_performed <= self.retry_count:
+            # Handle running out of API calls
+            sleep_time = self._rate_limit_sleep_time(rate_limit_key)
+            if sleep_time > 0:
+                log.warning("Rate limit reached. Sleeping for: %d", sleep_time)
+                await asyncio.sleep(sleep_time + 1)  # Sleep for extra sec
+
+            # Apply authentication
+            request = prepared.copy()
+            if self.auth:
+                request = self.auth.apply_auth()(request)
+
+            # Execute request
+            self._pending_calls[rate_limit_key] = (
+                self._pending_calls.get(rate_limit_key, 0) + 1
+            )
+            try:
+                async with self.session.request(
+                    request.method, request.url, headers=request.headers,
+                    data=request.body, proxy=self.proxy.get('https')
+                ) as resp:
+                    resp = await self._to_response(resp)
+            except Exception as e:
+                raise TweepyException(f'Failed to send request: {e}') from e
+            finally:
+                self._pending_calls[rate_limit_key] -= 1
+
+            remaining_calls = self._update_rate_limit(rate_limit_key, resp)
+            if self._ran_out_of_calls(resp, remaining_calls):
+                # If ran out of calls before waiting switching retry last call
+                continue
+
+            retry_delay = self._retry_delay(resp)
+            if retry_delay is None:
+                break
+
+            # Sleep before retrying request again
+            await asyncio.sleep(retry_delay)
+            retries_performed += 1
+
+        return self._process_response(resp, **kwargs)
+
+    def _rate_limit_sleep_time(self, rate_limit_key):
+        # Requests that are still in flight will use up remaining calls as
+        # well, so that concurrent requests don't all make the last call
+        if not self.wait_on_rate_limit:
+            return 0
+        remaining_calls, reset_time = self._rate_limits.get(
+            rate_limit_key, (None, None)
+        )
+        pending_calls = self._pending_calls.get(rate_limit_key, 0)
+        if (reset_time is not None and remaining_calls is not None
+            and remaining_calls - pending_calls < 1):
+            return reset_time - int(time.time())
+        return 0
+
+    async def _to_response(self, resp):
+        # Wrap the aiohttp response in a requests Response, so that it can be
+        # handled and raised in exceptions the same way as with API
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = str(resp.url)
+        response.encoding = resp.charset
+        response._content = await resp.read()
+        return response
+
+    async def _lookup_request(self, method, endpoint, *, lookup_parameters,
+                              **kwargs):
+        lookups = self._split_lookup(lookup_parameters, kwargs)
+        results = await asyncio.gather(*(
+            self.request(method, endpoint, **lookup, **kwargs)
+            for lookup in lookups
+        ))
+        if len(results) == 1:
+            return results[0]
+        return self._combine_lookup_results(list(results))
+
+    async def _bulk_request(self, method, endpoint, *, lookup_parameters,
+                            chunk_size=100, **kwargs):
+        for lookup in self._split_bulk_request(
+            lookup_parameters, kwargs, chunk_size
+        ):
+            result = await self.request(method, endpoint, **lookup, **kwargs)
+        return result
+
+    async def chunked_upload(self, filename, *, file=None, file_type=None,
+                             wait_for_async_finalize=True, media_category=None,
+                             additional_owners=None, max_workers=1,
+                             **kwargs):
+        """chunked_upload( \
+            filename, *, file, file_type, wait_for_async_finalize, \
+            media_category, additional_owners, max_workers \
+        )
+
+        Asynchronous version of :meth:`API.chunked_upload`
+
+        Unlike with :meth:`API.chunked_upload`, up to ``max_workers`` chunks
+        are uploaded concurrently when ``file`` is specified as well, as each
+        chunk is read before its request is made.
+        """
+        fp = file if file is not None else open(filename, 'rb')
+        file_size, chunk_size, segments = _chunk_sizes(
+            fp, kwargs.pop('chunk_size', None)
+        )
+
+        with fp:
+            media = await self.chunked_upload_init(
+                file_size, file_type, media_category=media_category,
+                additional_owners=additional_owners, **kwargs
+            )
+
+            appends = set()
+            for segment_index in range(segments):
+                if len(appends) >= max_workers:
+                    done, appends = await asyncio.wait(
+                        appends, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for append in done:
+                        append.result()
+                # The APPEND command returns an empty response body
+                appends.add(asyncio.ensure_future(self.chunked_upload_append(
+                    media.media_id,
+                    (os.path.basename(filename), fp.read(chunk_size)),
+                    segment_index, **kwargs
+                )))
+            await asyncio.gather(*appends)
+
+        media = await self.chunked_upload_finalize(media.media_id, **kwargs)
+
+        if wait_for_async_finalize and hasattr(media, 'processing_info'):
+            while media.processing_info['state'] in ('pending', 'in_progress'):
+                await asyncio.sleep(media.processing_info['check_after_secs'])
+                media = await self.get_media_upload_status(
+                    media.media_id, **kwargs
+                )
+
+        return media
@@ -3,7 +3,6 @@
 # See LICENSE for details.
 
 import asyncio
-import json
 import logging
 from math import inf
 from platform import python_version
@@ -15,6 +14,7 @@ from yarl import URL
 import tweepy
 from tweepy.errors import TweepyException
 from tweepy.models import Status
+from tweepy.utils import json_lib
 
 log = logging.getLogger(__name__)
 
@@ -371,7 +371,7 @@ class AsyncStream:
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/tweets/filter-realtime/guides/streaming-message-types
         """
-        data = json.loads(raw_data)
+        data = json_lib.loads(raw_data)
 
         if "in_reply_to_status_id" in data:
             status = Status.parse(None, data)
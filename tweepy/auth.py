@@ -2,9 +2,14 @@
 # Copyright 2009-2022 Joshua Roesslein
 # See LICENSE for details.
 
+import binascii
+import hashlib
+import hmac
 import logging
 import warnings
 
+from oauthlib.common import quote
+from oauthlib.oauth1 import Client, SIGNATURE_HMAC_SHA1
 import requests
 from requests.auth import AuthBase, HTTPBasicAuth
 from requests_oauthlib import OAuth1, OAuth1Session, OAuth2Session
@@ -18,6 +23,42 @@ https://dev.twitter.com/discussions/21281"""
 log = logging.getLogger(__name__)
 
 
+def _sign_hmac_sha1(base_string, client):
+    signature = client._keyed_hmac_sha1().copy()
+    signature.update(base_string.encode('utf-8'))
+    return binascii.b2a_base64(signature.digest())[:-1].decode('utf-8')
+
+
+class _OAuth1Client(Client):
+    SIGNATURE_METHODS = {
+        **Client.SIGNATURE_METHODS, SIGNATURE_HMAC_SHA1: _sign_hmac_sha1
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hmac_secrets = None
+        self._hmac = None
+
+    def __getstate__(self):
+        # Hash objects can't be pickled or copied, but can be recomputed
+        state = self.__dict__.copy()
+        state['_hmac_secrets'] = state['_hmac'] = None
+        return state
+
+    def _keyed_hmac_sha1(self):
+        # The HMAC key only depends on the secrets, so the keyed hash state is
+        # computed once for this client and copied for each signature
+        secrets = self.client_secret, self.resource_owner_secret
+        if self._hmac is None or secrets != self._hmac_secrets:
+            key = (
+                quote(self.client_secret or '', safe=b'~') + '&' +
+                quote(self.resource_owner_secret or '', safe=b'~')
+            )
+            self._hmac = hmac.new(key.encode('utf-8'), digestmod=hashlib.sha1)
+            self._hmac_secrets = secrets
+        return self._hmac
+
+
 class OAuth1UserHandler:
     """OAuth 1.0a User Context authentication handler
 
@@ -43,13 +84,24 @@ class OAuth1UserHandler:
         self.request_token = {}
         self.oauth = OAuth1Session(consumer_key, client_secret=consumer_secret,
                                    callback_uri=self.callback)
+        self._auth = None
+        self._auth_credentials = None
 
     def apply_auth(self):
-        return OAuth1(
-            self.consumer_key, client_secret=self.consumer_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret, decoding=None
+        # Reuse the same signer for as long as the credentials are unchanged
+        credentials = (
+            self.consumer_key, self.consumer_secret,
+            self.access_token, self.access_token_secret
         )
+        if self._auth is None or self._auth_credentials != credentials:
+            self._auth = OAuth1(
+                self.consumer_key, client_secret=self.consumer_secret,
+                resource_owner_key=self.access_token,
+                resource_owner_secret=self.access_token_secret,
+                decoding=None, client_class=_OAuth1Client
+            )
+            self._auth_credentials = credentials
+        return self._auth
 
     def _get_oauth_url(self, endpoint):
         return 'https://api.twitter.com/oauth/' + endpoint
@@ -17,6 +17,7 @@ import time
 import warnings
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import tweepy
 from tweepy.auth import OAuth1UserHandler
@@ -31,11 +32,14 @@ from tweepy.poll import Poll
 from tweepy.space import Space
 from tweepy.tweet import Tweet
 from tweepy.user import User
+from tweepy.utils import json_lib
 
 log = logging.getLogger(__name__)
 
 Response = namedtuple("Response", ("data", "includes", "errors", "meta"))
 
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
 
 class BaseClient:
 
@@ -53,44 +57,76 @@ class BaseClient:
         self.return_type = return_type
         self.wait_on_rate_limit = wait_on_rate_limit
 
+        # Keep enough connections to Twitter alive for a Client that's
+        # shared across threads to reuse them rather than reconnecting
         self.session = requests.Session()
+        self.session.mount(
+            'https://', HTTPAdapter(pool_connections=10, pool_maxsize=100)
+        )
         self.user_agent = (
             f"Python/{python_version()} "
             f"Requests/{requests.__version__} "
             f"Tweepy/{tweepy.__version__}"
         )
 
-    def request(self, method, route, params=None, json=None, user_auth=False):
-        host = "https://api.twitter.com"
+        # Remaining calls and reset time of the rate limit for each endpoint
+        self._rate_limits = {}
+
+        # OAuth 1.0a User Context signer and the credentials it was made with
+        self._oauth_1_auth = None
+        self._oauth_1_credentials = None
+
+    def request(self, method, route, params=None, json=None, user_auth=False,
+                rate_limit_route=None):
+        # Rate limits are tracked across requests, so that waiting happens
+        # before making a request that would exceed them. They're shared by
+        # every request to an endpoint, regardless of the IDs in its route,
+        # so those endpoints pass a template of their route for them.
+        rate_limit_key = method, rate_limit_route or route, user_auth
+        if self.wait_on_rate_limit and rate_limit_key in self._rate_limits:
+            remaining, reset_time = self._rate_limits[rate_limit_key]
+            sleep_time = reset_time - int(time.time()) + 1
+            if remaining < 1 and sleep_time > 0:
+                log.warning(
+                    "Rate limit reached. Sleeping for %d seconds.", sleep_time
+                )
+                time.sleep(sleep_time)
+
+        url = "https://api.twitter.com" + route
         headers = {"User-Agent": self.user_agent}
         auth = None
         if user_auth:
-            auth = OAuth1UserHandler(
-                self.consumer_key, self.consumer_secret,
-                self.access_token, self.access_token_secret
-            )
-            auth = auth.apply_auth()
+            auth = self._get_oauth_1_auth()
         else:
             headers["Authorization"] = f"Bearer {self.bearer_token}"
 
         log.debug(
-            f"Making API request: {method} {host + route}\n"
-            f"Parameters: {params}\n"
-            f"Headers: {headers}\n"
-            f"Body: {json}"
+            "Making API request: %s %s\n"
+            "Parameters: %s\n"
+            "Headers: %s\n"
+            "Body: %s",
+            method, url, params, headers, json
         )
 
         with self.session.request(
-            method, host + route, params=params, json=json, headers=headers,
-            auth=auth
+            method, url, params=params, json=json, headers=headers, auth=auth
         ) as response:
             log.debug(
-                "Received API response: "
-                f"{response.status_code} {response.reason}\n"
-                f"Headers: {response.headers}\n"
-                f"Content: {response.content}"
+                "Received API response: %s %s\n"
+                "Headers: %s\n"
+                "Content: %s",
+                response.status_code, response.reason, response.headers,
+                response.content
             )
 
+            remaining = response.headers.get("x-rate-limit-remaining")
+            reset_time = response.headers.get("x-rate-limit-reset")
+            if (self.wait_on_rate_limit and remaining is not None
+                    and reset_time is not None):
+                self._rate_limits[rate_limit_key] = (
+                    int(remaining), int(reset_time)
+                )
+
             if response.status_code == 400:
                 raise BadRequest(response)
             if response.status_code == 401:
@@ -105,11 +141,14 @@ class BaseClient:
                     sleep_time = reset_time - int(time.time()) + 1
                     if sleep_time > 0:
                         log.warning(
-                            "Rate limit exceeded. "
-                            f"Sleeping for {sleep_time} seconds."
+                            "Rate limit exceeded. Sleeping for %d seconds.",
+                            sleep_time
                         )
                         time.sleep(sleep_time)
-                    return self.request(method, route, params, json, user_auth)
+                    return self.request(
+                        method, route, params, json, user_auth,
+                        rate_limit_route
+                    )
                 else:
                     raise TooManyRequests(response)
             if response.status_code >= 500:
@@ -120,16 +159,18 @@ class BaseClient:
             return response
 
     def _make_request(self, method, route, params={}, endpoint_parameters=None,
-                      json=None, data_type=None, user_auth=False):
+                      json=None, data_type=None, user_auth=False,
+                      rate_limit_route=None):
         request_params = self._process_params(params, endpoint_parameters)
 
         response = self.request(method, route, params=request_params,
-                                json=json, user_auth=user_auth)
+                                json=json, user_auth=user_auth,
+                                rate_limit_route=rate_limit_route)
 
         if self.return_type is requests.Response:
             return response
 
-        response = response.json()
+        response = json_lib.loads(response.content)
 
         if self.return_type is dict:
             return response
@@ -145,6 +186,18 @@ class BaseClient:
 
         return Response(data, includes, errors, meta)
 
+    def _get_oauth_1_auth(self):
+        # Reuse the same signer for as long as the credentials are unchanged
+        credentials = (
+            self.consumer_key, self.consumer_secret,
+            self.access_token, self.access_token_secret
+        )
+        if (self._oauth_1_auth is None
+                or self._oauth_1_credentials != credentials):
+            self._oauth_1_auth = OAuth1UserHandler(*credentials).apply_auth()
+            self._oauth_1_credentials = credentials
+        return self._oauth_1_auth
+
     def _process_data(self, data, data_type=None):
         if data_type is not None:
             if isinstance(data, list):
@@ -169,8 +222,9 @@ class BaseClient:
     def _process_params(self, params, endpoint_parameters):
         request_params = {}
         for param_name, param_value in params.items():
-            if param_name.replace('_', '.') in endpoint_parameters:
-                param_name = param_name.replace('_', '.')
+            dotted_param_name = param_name.replace('_', '.')
+            if dotted_param_name in endpoint_parameters:
+                param_name = dotted_param_name
 
             if isinstance(param_value, list):
                 request_params[param_name] = ','.join(map(str, param_value))
@@ -178,14 +232,13 @@ class BaseClient:
                 if param_value.tzinfo is not None:
                     param_value = param_value.astimezone(datetime.timezone.utc)
                 request_params[param_name] = param_value.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ"
+                    DATETIME_FORMAT
                 )
-                # TODO: Constant datetime format string?
             else:
                 request_params[param_name] = param_value
 
             if param_name not in endpoint_parameters:
-                log.warn(f"Unexpected parameter: {param_name}")
+                log.warning("Unexpected parameter: %s", param_name)
         return request_params
 
 
@@ -301,7 +354,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/bookmarks/{tweet_id}"
 
         return self._make_request(
-            "DELETE", route
+            "DELETE", route,
+            rate_limit_route="/2/users/:id/bookmarks/:tweet_id"
         )
 
     def get_bookmarks(self, **params):
@@ -369,7 +423,7 @@ class Client(BaseClient):
                 "expansions", "max_results", "media.fields",
                 "pagination_token", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=Tweet
+            ), data_type=Tweet, rate_limit_route="/2/users/:id/bookmarks"
         )
 
     def bookmark(self, tweet_id):
@@ -407,7 +461,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/bookmarks"
 
         return self._make_request(
-            "POST", route, json={"tweet_id": str(tweet_id)}
+            "POST", route, json={"tweet_id": str(tweet_id)},
+            rate_limit_route="/2/users/:id/bookmarks"
         )
 
     # Hide replies
@@ -436,7 +491,7 @@ class Client(BaseClient):
         """
         return self._make_request(
             "PUT", f"/2/tweets/{id}/hidden", json={"hidden": True},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/tweets/:id/hidden"
         )
 
     def unhide_reply(self, id, *, user_auth=True):
@@ -463,7 +518,7 @@ class Client(BaseClient):
         """
         return self._make_request(
             "PUT", f"/2/tweets/{id}/hidden", json={"hidden": False},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/tweets/:id/hidden"
         )
 
     # Likes
@@ -514,7 +569,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/likes/{tweet_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/likes/:tweet_id"
         )
 
     def get_liking_users(self, id, *, user_auth=False, **params):
@@ -572,7 +628,8 @@ class Client(BaseClient):
                 "expansions", "max_results", "media.fields",
                 "pagination_token", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/tweets/:id/liking_users"
         )
 
     def get_liked_tweets(self, id, *, user_auth=False, **params):
@@ -632,7 +689,8 @@ class Client(BaseClient):
                 "expansions", "max_results", "media.fields",
                 "pagination_token", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=Tweet, user_auth=user_auth
+            ), data_type=Tweet, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/liked_tweets"
         )
 
     def like(self, tweet_id, *, user_auth=True):
@@ -679,7 +737,7 @@ class Client(BaseClient):
 
         return self._make_request(
             "POST", route, json={"tweet_id": str(tweet_id)},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/users/:id/likes"
         )
 
     # Manage Tweets
@@ -708,7 +766,8 @@ class Client(BaseClient):
         https://developer.twitter.com/en/docs/twitter-api/tweets/manage-tweets/api-reference/delete-tweets-id
         """
         return self._make_request(
-            "DELETE", f"/2/tweets/{id}", user_auth=user_auth
+            "DELETE", f"/2/tweets/{id}", user_auth=user_auth,
+            rate_limit_route="/2/tweets/:id"
         )
 
     def create_tweet(
@@ -887,7 +946,8 @@ class Client(BaseClient):
                 "expansions", "max_results", "media.fields",
                 "pagination_token", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=Tweet, user_auth=user_auth
+            ), data_type=Tweet, user_auth=user_auth,
+            rate_limit_route="/2/tweets/:id/quote_tweets"
         )
 
     # Retweets
@@ -939,7 +999,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/retweets/{source_tweet_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/retweets/:source_tweet_id"
         )
 
     def get_retweeters(self, id, *, user_auth=False, **params):
@@ -997,7 +1058,8 @@ class Client(BaseClient):
                 "expansions", "max_results", "media.fields",
                 "pagination_token", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/tweets/:id/retweeted_by"
         )
 
     def retweet(self, tweet_id, *, user_auth=True):
@@ -1044,7 +1106,7 @@ class Client(BaseClient):
 
         return self._make_request(
             "POST", route, json={"tweet_id": str(tweet_id)},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/users/:id/retweets"
         )
 
     # Search Tweets
@@ -1354,7 +1416,8 @@ class Client(BaseClient):
                 "end_time", "expansions", "max_results", "media.fields",
                 "pagination_token", "place.fields", "poll.fields", "since_id",
                 "start_time", "tweet.fields", "until_id", "user.fields"
-            ), data_type=Tweet, user_auth=user_auth
+            ), data_type=Tweet, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/mentions"
         )
 
     def get_users_tweets(self, id, *, user_auth=False, **params):
@@ -1464,7 +1527,8 @@ class Client(BaseClient):
                 "media.fields", "pagination_token", "place.fields",
                 "poll.fields", "since_id", "start_time", "tweet.fields",
                 "until_id", "user.fields"
-            ), data_type=Tweet, user_auth=user_auth
+            ), data_type=Tweet, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/tweets"
         )
 
     # Tweet counts
@@ -1652,7 +1716,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "media.fields", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=Tweet, user_auth=user_auth
+            ), data_type=Tweet, user_auth=user_auth,
+            rate_limit_route="/2/tweets/:id"
         )
 
     def get_tweets(self, ids, *, user_auth=False, **params):
@@ -1751,7 +1816,10 @@ class Client(BaseClient):
         route = f"/2/users/{source_user_id}/blocking/{target_user_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route=(
+                "/2/users/:source_user_id/blocking/:target_user_id"
+            )
         )
 
     def get_blocked(self, *, user_auth=True, **params):
@@ -1818,7 +1886,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/blocking"
         )
 
     def block(self, target_user_id, *, user_auth=True):
@@ -1865,7 +1934,7 @@ class Client(BaseClient):
 
         return self._make_request(
             "POST", route, json={"target_user_id": str(target_user_id)},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/users/:id/blocking"
         )
 
     # Follows
@@ -1919,7 +1988,10 @@ class Client(BaseClient):
         route = f"/2/users/{source_user_id}/following/{target_user_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route=(
+                "/2/users/:source_user_id/following/:target_user_id"
+            )
         )
 
     def unfollow(self, target_user_id, *, user_auth=True):
@@ -1979,7 +2051,8 @@ class Client(BaseClient):
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
             ),
-            data_type=User, user_auth=user_auth
+            data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/followers"
         )
 
     def get_users_following(self, id, *, user_auth=False, **params):
@@ -2026,7 +2099,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/following"
         )
 
     def follow_user(self, target_user_id, *, user_auth=True):
@@ -2083,7 +2157,8 @@ class Client(BaseClient):
 
         return self._make_request(
             "POST", route, json={"target_user_id": str(target_user_id)},
-            user_auth=user_auth
+            user_auth=user_auth,
+            rate_limit_route="/2/users/:source_user_id/following"
         )
 
     def follow(self, target_user_id, *, user_auth=True):
@@ -2146,7 +2221,8 @@ class Client(BaseClient):
         route = f"/2/users/{source_user_id}/muting/{target_user_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route="/2/users/:source_user_id/muting/:target_user_id"
         )
 
     def get_muted(self, *, user_auth=True, **params):
@@ -2215,7 +2291,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/muting"
         )
 
     def mute(self, target_user_id, *, user_auth=True):
@@ -2262,7 +2339,7 @@ class Client(BaseClient):
 
         return self._make_request(
             "POST", route, json={"target_user_id": str(target_user_id)},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/users/:id/muting"
         )
 
     # User lookup
@@ -2310,15 +2387,18 @@ class Client(BaseClient):
 
         if id is not None:
             route += f"/{id}"
+            rate_limit_route = "/2/users/:id"
         elif username is not None:
             route += f"/by/username/{username}"
+            rate_limit_route = "/2/users/by/username/:username"
         else:
             raise TypeError("ID or username is required")
 
         return self._make_request(
             "GET", route, params=params,
             endpoint_parameters=("expansions", "tweet.fields", "user.fields"),
-            data_type=User, user_auth=user_auth
+            data_type=User, user_auth=user_auth,
+            rate_limit_route=rate_limit_route
         )
 
     def get_users(self, *, ids=None, usernames=None, user_auth=False,
@@ -2555,7 +2635,7 @@ class Client(BaseClient):
             "GET", f"/2/spaces/{id}", params=params,
             endpoint_parameters=(
                 "expansions", "space.fields", "user.fields"
-            ), data_type=Space
+            ), data_type=Space, rate_limit_route="/2/spaces/:id"
         )
 
     def get_space_buyers(self, id, **params):
@@ -2601,7 +2681,7 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "media.fields", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=User
+            ), data_type=User, rate_limit_route="/2/spaces/:id/buyers"
         )
 
     def get_space_tweets(self, id, **params):
@@ -2645,7 +2725,7 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "media.fields", "place.fields", "poll.fields",
                 "tweet.fields", "user.fields"
-            ), data_type=Tweet
+            ), data_type=Tweet, rate_limit_route="/2/spaces/:id/tweets"
         )
 
     # List Tweets lookup
@@ -2696,7 +2776,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
-            ), data_type=Tweet, user_auth=user_auth
+            ), data_type=Tweet, user_auth=user_auth,
+            rate_limit_route="/2/lists/:id/tweets"
         )
 
     # List follows
@@ -2746,7 +2827,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/followed_lists/{list_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/followed_lists/:list_id"
         )
 
     def get_list_followers(self, id, *, user_auth=False, **params):
@@ -2795,7 +2877,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/lists/:id/followers"
         )
 
     def get_followed_lists(self, id, *, user_auth=False, **params):
@@ -2844,7 +2927,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "list.fields", "max_results", "pagination_token",
                 "user.fields"
-            ), data_type=List, user_auth=user_auth
+            ), data_type=List, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/followed_lists"
         )
 
     def follow_list(self, list_id, *, user_auth=True):
@@ -2892,7 +2976,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/followed_lists"
 
         return self._make_request(
-            "POST", route, json={"list_id": str(list_id)}, user_auth=user_auth
+            "POST", route, json={"list_id": str(list_id)}, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/followed_lists"
         )
 
     # List lookup
@@ -2930,7 +3015,8 @@ class Client(BaseClient):
             "GET", f"/2/lists/{id}", params=params,
             endpoint_parameters=(
                 "expansions", "list.fields", "user.fields"
-            ), data_type=List, user_auth=user_auth
+            ), data_type=List, user_auth=user_auth,
+            rate_limit_route="/2/lists/:id"
         )
 
     def get_owned_lists(self, id, *, user_auth=False, **params):
@@ -2979,7 +3065,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "list.fields", "max_results", "pagination_token",
                 "user.fields"
-            ), data_type=List, user_auth=user_auth
+            ), data_type=List, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/owned_lists"
         )
 
     # List members
@@ -3012,7 +3099,8 @@ class Client(BaseClient):
         """
 
         return self._make_request(
-            "DELETE", f"/2/lists/{id}/members/{user_id}", user_auth=user_auth
+            "DELETE", f"/2/lists/{id}/members/{user_id}", user_auth=user_auth,
+            rate_limit_route="/2/lists/:id/members/:user_id"
         )
 
     def get_list_members(self, id, *, user_auth=False, **params):
@@ -3061,7 +3149,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "max_results", "pagination_token",
                 "tweet.fields", "user.fields"
-            ), data_type=User, user_auth=user_auth
+            ), data_type=User, user_auth=user_auth,
+            rate_limit_route="/2/lists/:id/members"
         )
 
     def get_list_memberships(self, id, *, user_auth=False, **params):
@@ -3110,7 +3199,8 @@ class Client(BaseClient):
             endpoint_parameters=(
                 "expansions", "list.fields", "max_results", "pagination_token",
                 "user.fields"
-            ), data_type=List, user_auth=user_auth
+            ), data_type=List, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/list_memberships"
         )
 
     def add_list_member(self, id, user_id, *, user_auth=True):
@@ -3140,7 +3230,7 @@ class Client(BaseClient):
         """
         return self._make_request(
             "POST", f"/2/lists/{id}/members", json={"user_id": str(user_id)},
-            user_auth=user_auth
+            user_auth=user_auth, rate_limit_route="/2/lists/:id/members"
         )
 
     # Manage Lists
@@ -3170,7 +3260,8 @@ class Client(BaseClient):
         """
 
         return self._make_request(
-            "DELETE", f"/2/lists/{id}", user_auth=user_auth
+            "DELETE", f"/2/lists/{id}", user_auth=user_auth,
+            rate_limit_route="/2/lists/:id"
         )
 
     def update_list(self, id, *, description=None, name=None, private=None,
@@ -3216,7 +3307,8 @@ class Client(BaseClient):
             json["private"] = private
 
         return self._make_request(
-            "PUT", f"/2/lists/{id}", json=json, user_auth=user_auth
+            "PUT", f"/2/lists/{id}", json=json, user_auth=user_auth,
+            rate_limit_route="/2/lists/:id"
         )
 
     def create_list(self, name, *, description=None, private=None,
@@ -3306,7 +3398,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/pinned_lists/{list_id}"
 
         return self._make_request(
-            "DELETE", route, user_auth=user_auth
+            "DELETE", route, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/pinned_lists/:list_id"
         )
 
     def get_pinned_lists(self, *, user_auth=True, **params):
@@ -3364,7 +3457,8 @@ class Client(BaseClient):
             "GET", route, params=params,
             endpoint_parameters=(
                 "expansions", "list.fields", "user.fields"
-            ), data_type=List, user_auth=user_auth
+            ), data_type=List, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/pinned_lists"
         )
 
     def pin_list(self, list_id, *, user_auth=True):
@@ -3412,7 +3506,8 @@ class Client(BaseClient):
         route = f"/2/users/{id}/pinned_lists"
 
         return self._make_request(
-            "POST", route, json={"list_id": str(list_id)}, user_auth=user_auth
+            "POST", route, json={"list_id": str(list_id)}, user_auth=user_auth,
+            rate_limit_route="/2/users/:id/pinned_lists"
         )
 
     # Batch Compliance
@@ -3467,7 +3562,8 @@ class Client(BaseClient):
         https://developer.twitter.com/en/docs/twitter-api/compliance/batch-compliance/api-reference/get-compliance-jobs-id
         """
         return self._make_request(
-            "GET", f"/2/compliance/jobs/{id}"
+            "GET", f"/2/compliance/jobs/{id}",
+            rate_limit_route="/2/compliance/jobs/:id"
         )
 
     def create_compliance_job(self, type, *, name=None, resumable=None):
@@ -2,10 +2,9 @@
 # Copyright 2009-2022 Joshua Roesslein
 # See LICENSE for details.
 
-import json as json_lib
-
 from tweepy.errors import TweepyException
 from tweepy.models import ModelFactory
+from tweepy.utils import json_lib
 
 
 class Parser:
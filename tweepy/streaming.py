@@ -5,7 +5,6 @@
 # Appengine users: https://developers.google.com/appengine/docs/python/sockets/#making_httplib_use_sockets
 
 from collections import namedtuple
-import json
 import logging
 from math import inf
 from platform import python_version
@@ -23,6 +22,7 @@ from tweepy.client import BaseClient, Response
 from tweepy.errors import TweepyException
 from tweepy.models import Status
 from tweepy.tweet import Tweet
+from tweepy.utils import json_lib
 
 log = logging.getLogger(__name__)
 
@@ -402,7 +402,7 @@ class Stream(BaseStream):
         ----------
         https://developer.twitter.com/en/docs/twitter-api/v1/tweets/filter-realtime/guides/streaming-message-types
         """
-        data = json.loads(raw_data)
+        data = json_lib.loads(raw_data)
 
         if "in_reply_to_status_id" in data:
             status = Status.parse(None, data)
@@ -858,7 +858,7 @@ class StreamingClient(BaseClient, BaseStream):
         ----------
         https://developer.twitter.com/en/docs/twitter-api/tweets/filtered-stream/integrate/consuming-streaming-data
         """
-        data = json.loads(raw_data)
+        data = json_lib.loads(raw_data)
 
         tweet = None
         includes = {}
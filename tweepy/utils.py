@@ -4,8 +4,17 @@
 
 import datetime
 
+try:
+    # orjson is an optional, faster drop-in replacement for decoding JSON
+    import orjson as json_lib
+except ImportError:
+    import json as json_lib
+
 
 def list_to_csv(item_list):
+    if isinstance(item_list, str):
+        # Already comma separated, rather than a sequence of characters
+        return item_list or None
     if item_list:
         return ','.join(map(str, item_list))
 